@@ -0,0 +1,530 @@
+"""
+Shared pages and analysis helpers for the Rap Analyzer app.
+
+Streamlit re-executes the entry script on every rerun, but imported modules are
+loaded once, so the Deepgram client, worker pool and caches defined here persist
+across reruns.
+"""
+import streamlit as st
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+import jellyfish
+import pronouncing
+from deepgram import DeepgramClient, LiveOptions, LiveTranscriptionEvents, PrerecordedResponse
+import tempfile
+import os
+import hashlib
+import shutil
+import threading
+import time
+import bisect
+import itertools
+import re
+from functools import lru_cache
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+
+def landing_page():
+    st.title("🎵 Rap Analyzer & Music Comparison")
+    st.markdown("""
+    Welcome to the **Rapper’s Freestyle Analyzer**! This app allows you to:
+    - Analyze your rap flow & rhyme patterns 🎤
+    - Compare two songs to check for plagiarism 🎶
+    - Connect with us for feedback 💬
+    """)
+
+    st.sidebar.success("Select a page above ☝️")
+
+# Replace with your Deepgram API Key
+load_dotenv()
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+
+# On-disk cache of Deepgram responses, keyed by the audio file's SHA-256 digest
+TRANSCRIPT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rapanalyzer")
+TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", 7 * 24 * 60 * 60))  # seconds
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+def hash_file_chunked(path, chunk_size=HASH_CHUNK_SIZE):
+    """Return the SHA-256 hex digest of a file, reading it in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_cached_transcript(digest):
+    """Return the cached Deepgram response for an audio digest, or None if missing or expired."""
+    cache_path = os.path.join(TRANSCRIPT_CACHE_DIR, f"{digest}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) > TRANSCRIPT_CACHE_TTL:
+            return None
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            return PrerecordedResponse.from_json(cache_file.read())
+    except (OSError, ValueError):
+        return None
+
+def save_cached_transcript(digest, response):
+    """Store a Deepgram response in the on-disk cache under the audio digest."""
+    cache_path = os.path.join(TRANSCRIPT_CACHE_DIR, f"{digest}.json")
+    try:
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        # Each writer gets its own temp file so concurrent saves of one digest can't interleave
+        fd, tmp_path = tempfile.mkstemp(dir=TRANSCRIPT_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                cache_file.write(response.to_json())
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as err:
+        print(f"WARNING: could not cache transcript: {err}")
+
+# Background worker for fire-and-forget transcript cache writes
+_pool = ThreadPoolExecutor(max_workers=1)
+
+# Transcription options are constant, so build them once
+TRANSCRIPTION_OPTIONS = LiveOptions(
+    smart_format=True, model="nova-3", language="en-US"
+)
+STREAM_CHUNK_SIZE = 32 * 1024
+# Seconds without any message from Deepgram before giving up on the final results
+FINALIZE_TIMEOUT = float(os.getenv("DEEPGRAM_FINALIZE_TIMEOUT", 30))
+
+@st.cache_resource
+def _dg_client():
+    """Return a shared Deepgram client so its HTTP connection pool is reused."""
+    return DeepgramClient(DEEPGRAM_API_KEY)
+
+def transcribe_stream(audio_path):
+    """
+    Stream an audio file to Deepgram's live API and collect the finalized words.
+
+    The results are assembled into a PrerecordedResponse so the rest of the app
+    can treat them like a batch transcription.
+    """
+    segments = []
+    errors = []
+    finalized = []  # gets an entry once the results for the flushed audio arrive
+    done = threading.Event()
+    activity = threading.Event()
+
+    def on_transcript(_client, result, **kwargs):
+        if result.is_final and result.channel.alternatives:
+            segments.append(result.channel.alternatives[0])
+        if result.from_finalize:
+            finalized.append(True)
+            done.set()
+        activity.set()
+
+    def on_error(_client, error, **kwargs):
+        errors.append(error)
+        done.set()
+        activity.set()
+
+    def on_close(_client, *args, **kwargs):
+        done.set()
+        activity.set()
+
+    dg_connection = _dg_client().listen.websocket.v("1")
+    dg_connection.on(LiveTranscriptionEvents.Transcript, on_transcript)
+    dg_connection.on(LiveTranscriptionEvents.Error, on_error)
+    dg_connection.on(LiveTranscriptionEvents.Close, on_close)
+    if not dg_connection.start(TRANSCRIPTION_OPTIONS):
+        raise RuntimeError("Could not open a live connection to Deepgram")
+
+    try:
+        # Send the audio while Deepgram transcribes what it has already received
+        with open(audio_path, "rb") as audio_file:
+            while chunk := audio_file.read(STREAM_CHUNK_SIZE):
+                dg_connection.send(chunk)
+
+        # Flush the remaining audio and wait for its results before closing
+        dg_connection.finalize()
+        # Long files keep producing results well after the upload ends, so only give
+        # up once Deepgram has gone quiet for FINALIZE_TIMEOUT seconds
+        while not done.is_set() and activity.wait(FINALIZE_TIMEOUT):
+            activity.clear()
+    finally:
+        dg_connection.finish()
+
+    if errors:
+        raise RuntimeError(errors[0])
+    # A timeout or a close before the flushed results means the transcript is
+    # incomplete, so fail rather than let a partial response be cached
+    if not finalized:
+        raise RuntimeError(
+            "Deepgram closed the stream or went quiet for "
+            f"{FINALIZE_TIMEOUT:g}s before returning the final results"
+        )
+
+    words = [word.to_dict() for segment in segments for word in segment.words]
+    return PrerecordedResponse.from_dict({
+        "results": {
+            "channels": [{
+                "alternatives": [{
+                    "transcript": " ".join(segment.transcript for segment in segments if segment.transcript),
+                    "confidence": (
+                        sum(word["confidence"] for word in words) / len(words) if words else 0
+                    ),
+                    "words": words,
+                }]
+            }]
+        }
+    })
+
+@st.cache_data(ttl=3600, max_entries=50, show_spinner=False)
+def _transcribe_cached(audio_hash, _audio_path):
+    """
+    Transcribe the audio with the given digest and return the response as a dict.
+
+    Results are memoized in memory by Streamlit, then on disk, before Deepgram is called.
+    """
+    cached = load_cached_transcript(audio_hash)
+    if cached is not None:
+        return cached.to_dict()
+
+    # Stream the file to Deepgram so transcription overlaps with sending it
+    response = transcribe_stream(_audio_path)
+
+    # Debugging: Print the response to check if it's working
+    print(response.to_json(indent=4))
+
+    # Write the cache in the background so the caller isn't blocked on disk I/O
+    _pool.submit(save_cached_transcript, audio_hash, response)
+
+    return response.to_dict()
+
+def transcribe_audio(audio_path):
+    """Transcribe an audio file using Deepgram's API and return the full response."""
+    if not os.path.exists(audio_path):
+        st.error("No file uploaded")
+        return None
+
+    try:
+        # Reuse a previous transcription of the same audio if we have one
+        digest = hash_file_chunked(audio_path)
+        response = PrerecordedResponse.from_dict(_transcribe_cached(digest, audio_path))
+
+        # Return the full response object
+        return response
+
+    except Exception as err:
+        st.error(f"Error transcribing: {err}")
+        print(f"ERROR: {err}")  # Debugging error message
+        return None
+
+def _extract_arrays(response):
+    """
+    Build the word list and start/end/confidence arrays from a Deepgram response.
+    """
+    words = (
+        response.results.channels[0].alternatives[0].words
+        if response.results.channels and response.results.channels[0].alternatives
+        else []
+    )
+    # Fill the columns in one pass. Attribute access is used because subscripting
+    # an SDK word (word["start"]) serializes the whole word to a dict each time.
+    n = len(words)
+    words_list = [""] * n
+    # Timings stay float64 so duration averages land in the same speed bins as the
+    # plain Python floats Deepgram returns
+    starts = np.empty(n, dtype=np.float64)
+    ends = np.empty(n, dtype=np.float64)
+    confidences = np.empty(n, dtype=np.float32)
+    for i, word in enumerate(words):
+        # Lowercase once here so rhymes, unique words and counts all agree on casing
+        words_list[i] = word.word.lower()
+        starts[i] = word.start
+        ends[i] = word.end
+        confidences[i] = word.confidence
+    return words_list, starts, ends, confidences
+
+VOWEL_GROUP = re.compile(r"[aeiouy]+")
+
+@lru_cache(maxsize=100_000)
+def rhyme_key(word):
+    """
+    Phonetic rhyme key for a lowercase word: its CMU dictionary phonemes from the last
+    stressed vowel on, or a spelling-based approximation for words the dictionary lacks.
+    """
+    phones = pronouncing.phones_for_word(word)
+    if phones:
+        return pronouncing.rhyming_part(phones[0])
+    return _spelled_rhyme_key(word)
+
+def _spelled_rhyme_key(word):
+    """
+    Approximate rhyme key from spelling: the last vowel group and the Metaphone code of the
+    consonants after it, or of the consonants before it when the word ends in a vowel.
+    """
+    # A final e after a consonant is silent ("make", "rhyme") if an earlier vowel carries the sound
+    if len(word) > 2 and word[-1] == "e" and word[-2] not in "aeiouy" and VOWEL_GROUP.search(word[:-2]):
+        word = word[:-1]
+
+    groups = list(VOWEL_GROUP.finditer(word))
+    if not groups:
+        return ("", jellyfish.metaphone(word))
+
+    last = groups[-1]
+    # A lone "y" is the same vowel sound as "i" ("fly" / "high")
+    vowel = "i" if last.group() == "y" else last.group()
+    coda = word[last.end():]
+    if coda.endswith("gh"):  # silent in "high", "though"
+        coda = coda[:-2]
+    if coda:
+        # Prefix a vowel so Metaphone reads the trailing consonants in context
+        return (vowel, jellyfish.metaphone("a" + coda)[1:])
+
+    # The spelled vowel alone says little about how an open syllable sounds,
+    # so keep the consonants leading into it as well
+    onset = word[groups[-2].end() if len(groups) > 1 else 0:last.start()]
+    return (jellyfish.metaphone(onset), vowel, "")
+
+def group_rhymes(words):
+    """Group lowercase words that rhyme, keeping only groups with at least two words."""
+    buckets = defaultdict(list)
+    for word in words:
+        buckets[rhyme_key(word)].append(word)
+    return {key: bucket for key, bucket in buckets.items() if len(bucket) > 1}
+
+# Upper bounds (seconds per word) of the speed bins, from 10 (extremely fast) down to 2
+SPEED_THRESHOLDS = (0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+def speed_rating(avg_time_per_word):
+    """
+    Map the average time per word (seconds) onto a 1-10 rap speed rating.
+    """
+    # Comparing against the thresholds directly avoids float rounding in avg * 10
+    return 10 - bisect.bisect_right(SPEED_THRESHOLDS, avg_time_per_word)
+
+def compute_analysis(response):
+    """
+    Run every analysis measure over a Deepgram response and collect the results.
+    """
+    if not response:
+        return None
+
+    # Extract words and their metadata from the response
+    words_list, starts, ends, confidences = _extract_arrays(response)
+
+    if not words_list:
+        return None
+
+    word_counts = Counter(words_list)
+    rhyme_buckets = group_rhymes(words_list)
+
+    return {
+        "words_list": words_list,
+        "starts": starts,
+        "ends": ends,
+        "confidences": confidences,
+        "rhyme_buckets": rhyme_buckets,
+        "rhyme_pairs_count": sum(len(b) * (len(b) - 1) // 2 for b in rhyme_buckets.values()),
+        # cumsum adds left to right like the original sum(), keeping bin edges identical
+        "avg_time_per_word": float(np.cumsum(ends - starts)[-1] / len(words_list)),
+        "word_counts": word_counts,
+        "low_confidence_idx": np.flatnonzero(confidences < 0.8),
+    }
+
+def calculate_rap_rating(analysis):
+    """
+    Calculate an overall rap rating based on all analysis measures.
+    """
+    if not analysis:
+        return 0
+
+    n = len(analysis["words_list"])
+    word_counts = analysis["word_counts"]
+
+    # 1. Rhyme Density Analysis
+    rhyme_density = analysis["rhyme_pairs_count"] / n
+
+    # 2. Flow Analysis (Word Timing)
+    rap_speed_rating = speed_rating(analysis["avg_time_per_word"])
+
+    # 3. Word Complexity Analysis
+    word_complexity = len(word_counts) / n
+
+    # 4. Confidence Analysis
+    confidence_rating = 1 - (len(analysis["low_confidence_idx"]) / n)
+
+    # 5. Emphasis Analysis (Repeated Words)
+    repeated_words = sum(1 for count in word_counts.values() if count > 1)
+    emphasis_rating = repeated_words / n
+
+    # Calculate overall rap rating (weighted average)
+    overall_rating = (
+        (rhyme_density * 0.3) +  # Rhyme density contributes 30%
+        (rap_speed_rating * 0.2) +  # Rap speed contributes 20%
+        (word_complexity * 0.2) +  # Word complexity contributes 20%
+        (confidence_rating * 0.2) +  # Confidence contributes 20%
+        (emphasis_rating * 0.1)  # Emphasis contributes 10%
+    )
+
+    # Normalize the rating to a scale of 0 to 10
+    overall_rating = min(max(overall_rating * 10, 0), 10)
+
+    return overall_rating
+
+def rap_analyzer():
+    """Streamlit UI for Rap Analyzer with Advanced Analysis."""
+    st.title("🎤 Rap Analyzer")
+
+    uploaded_file = st.file_uploader("Upload your rap audio (MP3, WAV)", type=["mp3", "wav"])
+
+    if uploaded_file:
+        st.success(f"File uploaded: {uploaded_file.name}")
+
+        if st.button("Analyze Rap"):
+            # Stream the upload to a temporary file in chunks rather than reading it all into memory
+            uploaded_file.seek(0)
+            temp_audio = tempfile.NamedTemporaryFile(
+                suffix=os.path.splitext(uploaded_file.name)[1], delete=False
+            )
+            temp_audio_path = temp_audio.name
+            try:
+                with temp_audio:
+                    shutil.copyfileobj(uploaded_file, temp_audio, length=HASH_CHUNK_SIZE)
+
+                # Transcribe the audio file
+                with st.spinner("Transcribing..."):
+                    response = transcribe_audio(temp_audio_path)
+            finally:
+                os.unlink(temp_audio_path)
+
+            if response:
+                # Extract the transcript text
+                transcript = (
+                    response.results.channels[0].alternatives[0].transcript
+                    if response.results.channels and response.results.channels[0].alternatives
+                    else "No transcript available"
+                )
+
+                # Run the analysis once and derive the overall rap rating from it
+                analysis = compute_analysis(response)
+                rap_rating = calculate_rap_rating(analysis)
+
+                # Store the transcript, analysis and rating in session state
+                st.session_state.transcript = transcript
+                st.session_state.rap_rating = rap_rating
+                st.session_state.analysis = analysis
+
+            else:
+                st.error("Failed to transcribe audio.")
+
+        # Display the transcript and rating if available
+        if "transcript" in st.session_state and "rap_rating" in st.session_state:
+            st.subheader("Transcribed Lyrics:")
+            st.write(st.session_state.transcript)
+
+            st.subheader("🎤 Rap Rating")
+            st.write(f"**Overall Rap Rating:** {st.session_state.rap_rating:.1f}/10")
+
+            # Option to display detailed analysis
+            if st.checkbox("Show Detailed Analysis"):
+                st.subheader("📊 Detailed Analysis")
+                render_analysis(st.session_state.analysis)
+
+def render_analysis(analysis):
+    """
+    Display the detailed analysis computed by compute_analysis.
+    """
+    if not analysis:
+        st.warning("No word-level data available for analysis.")
+        return
+
+    words_list = analysis["words_list"]
+    confidences = analysis["confidences"]
+    word_counts = analysis["word_counts"]
+
+    # 1. Rhyme Density Analysis
+    st.markdown("### 🎵 Rhyme Density")
+    st.write(f"**Total Rhyme Pairs:** {analysis['rhyme_pairs_count']}")
+    if analysis["rhyme_buckets"]:
+        st.write("**Rhyme Pairs:**")
+        rhyme_df = pd.DataFrame(
+            itertools.chain.from_iterable(
+                itertools.combinations(bucket, 2) for bucket in analysis["rhyme_buckets"].values()
+            ),
+            columns=["Word A", "Word B"],
+        )
+        st.dataframe(rhyme_df, hide_index=True)
+
+    # 2. Flow Analysis (Word Timing)
+    st.markdown("### 🎶 Flow Analysis")
+    flow_df = pd.DataFrame({
+        "Word": words_list,
+        "Start": analysis["starts"],
+        "End": analysis["ends"],
+    })
+    st.write("**Word Timings:**")
+    st.dataframe(flow_df, hide_index=True, column_config={
+        "Start": st.column_config.NumberColumn(format="%.3f"),
+        "End": st.column_config.NumberColumn(format="%.3f"),
+    })
+
+    # 3. Word Complexity Analysis
+    st.markdown("### 📚 Word Complexity")
+    st.write(f"**Unique Words Used:** {len(word_counts)}")
+    st.write("**Top 10 Unique Words:**")
+    st.write(list(word_counts)[:10])
+
+    # 4. Confidence Analysis
+    st.markdown("### 🔍 Confidence Analysis")
+    low_confidence_idx = analysis["low_confidence_idx"]
+    st.write(f"**Low Confidence Words (Confidence < 0.8):** {len(low_confidence_idx)}")
+    if len(low_confidence_idx):
+        st.write("**Words with Low Confidence:**")
+        low_conf_df = pd.DataFrame({
+            "Word": [words_list[i] for i in low_confidence_idx],
+            "Confidence": confidences[low_confidence_idx],
+        })
+        st.dataframe(low_conf_df, hide_index=True, column_config={
+            "Confidence": st.column_config.NumberColumn(format="%.2f"),
+        })
+
+    # 5. Emphasis Analysis (Repeated Words)
+    st.markdown("### 🔄 Emphasis Analysis")
+    repeated_words = {word: count for word, count in word_counts.items() if count > 1}
+    st.write(f"**Repeated Words:** {len(repeated_words)}")
+    if repeated_words:
+        st.write("**Most Repeated Words:**")
+        rep_df = pd.DataFrame(
+            word_counts.most_common(min(10, len(repeated_words))), columns=["Word", "Count"]
+        )
+        st.dataframe(rep_df, hide_index=True)
+
+
+        
+        
+def music_comparison():
+    st.title("🎶 Music Comparison")
+    song1 = st.text_area("Enter Lyrics of Song 1")
+    song2 = st.text_area("Enter Lyrics of Song 2")
+    
+    if st.button("Compare Songs"):
+        if song1 and song2:
+            similarity = fuzz.ratio(song1.lower(), song2.lower())
+            st.subheader(f"Similarity Score: {similarity:.2f}%")
+            if similarity > 70:
+                st.warning("⚠️ High similarity detected! Possible plagiarism.")
+            else:
+                st.success("✅ The songs are significantly different.")
+        else:
+            st.error("Please enter lyrics for both songs.")
+
+def contact_page():
+    st.title("📩 Contact Us")
+    name = st.text_input("Your Name")
+    email = st.text_input("Your Email")
+    message = st.text_area("Your Message")
+    
+    if st.button("Submit"):
+        if name and email and message:
+            st.success("✅ Thank you for reaching out! We'll get back to you soon.")
+        else:
+            st.error("⚠️ Please fill out all fields.")
@@ -0,0 +1,95 @@
+import pytest
+from deepgram import PrerecordedResponse
+
+from rap_core import (
+    SPEED_THRESHOLDS,
+    _spelled_rhyme_key,
+    compute_analysis,
+    rhyme_key,
+    speed_rating,
+)
+
+
+@pytest.mark.parametrize("word1, word2", [
+    ("day", "way"),
+    ("say", "play"),
+    ("go", "no"),
+    ("know", "go"),
+    ("flow", "show"),
+    ("fly", "high"),
+    ("cat", "hat"),
+    ("time", "rhyme"),
+    ("make", "take"),
+    ("night", "light"),
+    ("back", "track"),
+    ("cash", "stash"),
+])
+def test_rhyming_words_share_a_key(word1, word2):
+    assert rhyme_key(word1) == rhyme_key(word2)
+
+
+@pytest.mark.parametrize("word1, word2", [
+    ("cat", "dog"),
+    ("day", "dog"),
+    ("go", "gate"),
+    ("fly", "flat"),
+    ("make", "the"),
+    ("time", "team"),
+    ("the", "she"),
+    ("to", "go"),
+    ("the", "me"),
+])
+def test_non_rhyming_words_differ(word1, word2):
+    assert rhyme_key(word1) != rhyme_key(word2)
+
+
+@pytest.mark.parametrize("word1, word2, rhymes", [
+    ("drippy", "flippy", True),
+    ("skeet", "fleet", True),
+    ("skrrt", "blurt", False),
+    ("gwalla", "shmoney", False),
+])
+def test_spelled_fallback(word1, word2, rhymes):
+    assert (_spelled_rhyme_key(word1) == _spelled_rhyme_key(word2)) == rhymes
+
+
+def baseline_speed_rating(flow_data):
+    """The original if/elif ladder from calculate_rap_speed."""
+    word_durations = [end - start for _, start, end in flow_data]
+    avg_time_per_word = sum(word_durations) / len(word_durations)
+    for rating, threshold in zip(range(10, 1, -1), SPEED_THRESHOLDS):
+        if avg_time_per_word < threshold:
+            return rating
+    return 1
+
+
+def make_response(timings):
+    words = [
+        {"word": "yo", "start": start, "end": end, "confidence": 0.9}
+        for start, end in timings
+    ]
+    return PrerecordedResponse.from_dict({
+        "results": {"channels": [{"alternatives": [{"transcript": "", "confidence": 0.9, "words": words}]}]}
+    })
+
+
+EDGE_TIMINGS = [
+    (start, round(start + duration + offset, 2))
+    for start in (0.0, 1.2, 10.1, 37.3)
+    for duration in SPEED_THRESHOLDS
+    for offset in (-0.01, 0.0, 0.01)
+]
+
+
+@pytest.mark.parametrize("start, end", EDGE_TIMINGS)
+def test_speed_rating_matches_baseline_bins(start, end):
+    analysis = compute_analysis(make_response([(start, end)]))
+    expected = baseline_speed_rating([("yo", start, end)])
+    assert speed_rating(analysis["avg_time_per_word"]) == expected
+
+
+def test_speed_rating_matches_baseline_over_several_words():
+    timings = EDGE_TIMINGS[::5]
+    analysis = compute_analysis(make_response(timings))
+    expected = baseline_speed_rating([("yo", start, end) for start, end in timings])
+    assert speed_rating(analysis["avg_time_per_word"]) == expected